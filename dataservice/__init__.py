@@ -5,6 +5,7 @@ from dataservice.clients import (
     PlaywrightPage,
 )
 from dataservice.config import (
+    BloomFilterConfig,
     CacheConfig,
     DelayConfig,
     PlaywrightConfig,
@@ -22,6 +23,7 @@ from dataservice.service import AsyncDataService, DataService
 __all__ = [
     "AsyncDataService",
     "BaseDataItem",
+    "BloomFilterConfig",
     "CacheConfig",
     "DataService",
     "DataServiceException",
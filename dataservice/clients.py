@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import warnings
 from abc import ABC
+from collections import deque
+from contextlib import AbstractAsyncContextManager, nullcontext
 from logging import getLogger
-from typing import Annotated, Any, Awaitable, Callable, NoReturn, Optional, Sequence
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    Callable,
+    NoReturn,
+    Optional,
+    Self,
+    Sequence,
+)
 
 import httpx
+import orjson
 from annotated_types import Ge, Le
 from pydantic import HttpUrl
 
@@ -52,6 +65,47 @@ except ImportError:
 logger = getLogger(__name__)
 
 
+def _json_body(request: Request) -> dict[str, Any]:
+    """Get the keyword arguments sending the JSON data of the request, serialized with orjson.
+
+    As with HTTPX, form data takes precedence over JSON data.
+
+    :param request: The request object containing the details of the HTTP request.
+    :return: The ``headers`` and, if there is JSON data to send, ``content`` keyword arguments.
+    """
+    if request.json_data is None or request.form_data:
+        return {"headers": request.headers}
+    headers = httpx.Headers(request.headers)
+    headers.setdefault("Content-Type", "application/json")
+    # Like json.dumps, accept int, float and bool keys, serializing them as strings
+    content = orjson.dumps(request.json_data, option=orjson.OPT_NON_STR_KEYS)
+    return {"headers": headers, "content": content}
+
+
+# Per-request dispatch tables of HttpXClient, keyed by request method and content type.
+_METHOD_FNS: dict[
+    str, Callable[[httpx.AsyncClient, Request], Awaitable[httpx.Response]]
+] = {
+    "GET": lambda client, request: client.get(
+        request.url,
+        params=request.params,
+        headers=request.headers,
+        timeout=request.timeout,
+    ),
+    "POST": lambda client, request: client.post(
+        request.url,
+        params=request.params,
+        data=request.form_data,
+        timeout=request.timeout,
+        **_json_body(request),
+    ),
+}
+_CONTENT_DECODERS: dict[str, Callable[[httpx.Response], Any]] = {
+    "text": lambda response: None,
+    "json": lambda response: orjson.loads(response.content),
+}
+
+
 class BaseClient(ABC):
     """Base client class."""
 
@@ -61,6 +115,19 @@ class BaseClient(ABC):
         """Make a request using the client."""
         return await self.make_request(*args, **kwargs)
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release any resource held by the client.
+
+        Neither ``DataWorker`` nor the data services close the clients of the requests,
+        so that a client can be shared. Close it with ``async with`` or by awaiting ``aclose``.
+        """
+
     async def make_request(
         self, request: Request
     ) -> Response | Sequence[Response] | NoReturn:
@@ -83,65 +150,220 @@ class BaseClient(ABC):
             raise NonRetryableException(status_text, status_code=status_code)
 
 
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limiter that adapts its limit to the overload rate of the requests.
+
+    The limit grows additively while requests succeed and is halved when the share of overloaded requests,
+    i.e. HTTP 429 or 503 responses and timeouts, in the recent window exceeds ``adjust_overload_rate``.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        min_concurrency: int = 1,
+        adjust_overload_rate: float = 0.1,
+        window: int = 20,
+    ):
+        """Initialize the AdaptiveConcurrencyLimiter.
+
+        :param max_concurrency: The maximum, and initial, number of concurrent requests.
+        :param min_concurrency: The minimum number of concurrent requests.
+        :param adjust_overload_rate: The overload rate above which the limit is decreased.
+        :param window: The number of recent requests used to compute the overload rate.
+        """
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("min_concurrency must be between 1 and max_concurrency.")
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.adjust_overload_rate = adjust_overload_rate
+        self.limit = max_concurrency
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._successes = 0
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    async def __aenter__(self) -> AdaptiveConcurrencyLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release(overloaded=self._is_overload(exc_val))
+
+    @staticmethod
+    def _is_overload(exc: BaseException | None) -> bool:
+        """Check if an exception signals that the server is overloaded."""
+        if isinstance(exc, TimeoutException):
+            return True
+        return isinstance(exc, DataServiceException) and exc.status_code in (429, 503)
+
+    async def acquire(self) -> None:
+        """Wait until a request can be made within the current limit."""
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Pass the wake-up on to the next waiter
+                    self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+
+    def release(self, overloaded: bool = False) -> None:
+        """Release a request slot and adjust the limit based on the request outcome.
+
+        :param overloaded: Whether the request signalled that the server is overloaded.
+        """
+        self._in_flight -= 1
+        self._outcomes.append(overloaded)
+        if overloaded:
+            self._successes = 0
+            overload_rate = sum(self._outcomes) / len(self._outcomes)
+            if overload_rate > self.adjust_overload_rate:
+                self.limit = max(self.min_concurrency, self.limit // 2)
+                logger.debug(f"Overload rate {overload_rate:.2f}, limit {self.limit}")
+                # Responses to requests sent at the previous limit must not decrease it again
+                self._outcomes.clear()
+        elif self.limit < self.max_concurrency:
+            self._successes += 1
+            if self._successes >= self.limit:
+                self.limit += 1
+                self._successes = 0
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wake up as many waiters as there are free slots."""
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
 class HttpXClient(BaseClient):
     """Client that uses HTTPX library to make requests."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+        http2: bool = True,
+        limits: Optional[httpx.Limits] = None,
+        max_concurrency: Optional[int] = None,
+        min_concurrency: int = 1,
+        adjust_overload_rate: float = 0.1,
+    ):
+        """Initialize the HttpXClient.
+
+        The underlying ``httpx.AsyncClient`` is created lazily on the first request and reused afterwards,
+        so that connections are pooled and kept alive across requests, until ``aclose`` is awaited.
+        The cookies set by responses are kept across requests too, like in a browser session:
+        use one ``HttpXClient`` per identity, e.g. per login or set of ``Authorization`` headers.
+
+        :param client: Optional pre-built ``httpx.AsyncClient`` to use for requests without a proxy.
+        :param http2: Whether to enable HTTP/2, multiplexing concurrent requests over a single connection per host.
+        :param limits: The connection pool limits of the ``httpx.AsyncClient``.
+            Defaults to 20 connections with HTTP/2 and 100 connections with HTTP/1.1.
+        :param max_concurrency: Optional maximum number of concurrent requests made by the client.
+            When set, the limit adapts between ``min_concurrency`` and ``max_concurrency``
+            according to the rate of overloaded requests, i.e. HTTP 429 or 503 responses and timeouts.
+        :param min_concurrency: The minimum number of concurrent requests. Only used with ``max_concurrency``.
+        :param adjust_overload_rate: The overload rate above which the concurrency limit is halved.
+            Only used with ``max_concurrency``.
+        """
+        if limits is None:
+            max_connections = 20 if http2 else 100
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            )
         self.async_client = httpx.AsyncClient
+        self.http2 = http2
+        self.limits = limits
+        self._client = client
+        self._clients: dict[str | None, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._concurrency: AbstractAsyncContextManager[Any] = nullcontext()
+        if max_concurrency:
+            self._concurrency = AdaptiveConcurrencyLimiter(
+                max_concurrency,
+                min_concurrency=min_concurrency,
+                adjust_overload_rate=adjust_overload_rate,
+            )
 
-    async def make_request(self, request: Request) -> Response | NoReturn:
-        """Make a request using HTTPX.
+    def _get_client(self, request: Request) -> httpx.AsyncClient:
+        """Get the pooled ``httpx.AsyncClient`` for the request, creating it if needed.
+
+        One client is kept per proxy, as HTTPX configures proxies at the client level.
+        Clients are bound to the event loop they were created in, so they are recreated when the loop changes.
 
         :param request: The request object containing the details of the HTTP request.
-        :return: A Response object containing the response data.
+        :return: The ``httpx.AsyncClient`` to use for the request.
         """
-        try:
-            logger.info(f"Requesting {request.url}")
-            return await self._get_response(request)
-        except httpx.HTTPStatusError as e:
-            logger.debug(f"HTTP Status Error making request: {e}")
-            status_code: Annotated[int, Ge(400), Le(600)] = e.response.status_code
-            self._raise_for_status(status_code, e.response.reason_phrase)
+        proxy = request.proxy.url if request.proxy else None
+        if proxy is None and self._client is not None:
+            return self._client
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._clients = {}
+            self._loop = loop
+        if proxy not in self._clients:
+            self._clients[proxy] = self.async_client(
+                proxy=proxy,
+                http2=self.http2,
+                limits=self.limits,
+                follow_redirects=True,
+            )
+        return self._clients[proxy]
 
-        except httpx.TimeoutException as e:
-            msg = f"Timeout making request: {e}, {e.__class__.__name__}"
-            logger.debug(msg)
-            raise TimeoutException(msg)
+    async def aclose(self) -> None:
+        """Close the pooled ``httpx.AsyncClient`` instances created by this client."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
 
-        except httpx.HTTPError as e:
-            msg = f"HTTP Error making request: {e}, {e.__class__.__name__}"
-            logger.debug(msg)
-            raise DataServiceException(msg)
+    async def make_request(self, request: Request) -> Response | NoReturn:
+        """Make a request using HTTPX.
 
-        assert False, "Should not reach this point"
+        :param request: The request object containing the details of the HTTP request.
+        :return: A Response object containing the response data.
+        """
+        async with self._concurrency:
+            try:
+                logger.info(f"Requesting {request.url}")
+                return await self._get_response(request)
+            except httpx.HTTPStatusError as e:
+                logger.debug(f"HTTP Status Error making request: {e}")
+                status_code: Annotated[int, Ge(400), Le(600)] = e.response.status_code
+                self._raise_for_status(status_code, e.response.reason_phrase)
+
+            except httpx.TimeoutException as e:
+                msg = f"Timeout making request: {e}, {e.__class__.__name__}"
+                logger.debug(msg)
+                raise TimeoutException(msg)
+
+            except httpx.HTTPError as e:
+                msg = f"HTTP Error making request: {e}, {e.__class__.__name__}"
+                logger.debug(msg)
+                raise DataServiceException(msg)
+
+            assert False, "Should not reach this point"
 
     async def _get_response(self, request) -> Response:
         """Get the response from the request.
         :param request: The request object containing the details of the HTTP request.
         :return: A Response object containing the response data.
         """
-        async with self.async_client(
-            headers=request.headers,
-            proxy=request.proxy.url if request.proxy else None,
-            timeout=request.timeout,
-            follow_redirects=True,
-        ) as client:
-            match request.method:
-                case "GET":
-                    response = await client.get(request.url, params=request.params)
-                case "POST":
-                    response = await client.post(
-                        request.url,
-                        params=request.params,
-                        data=request.form_data,
-                        json=request.json_data,
-                    )
-            response.raise_for_status()
-            match request.content_type:
-                case "text":
-                    data = None
-                case "json":
-                    data = response.json()
+        client = self._get_client(request)
+        response = await _METHOD_FNS[request.method](client, request)
+        response.raise_for_status()
+        data = _CONTENT_DECODERS[request.content_type](response)
         msg = f"Received response for {request.url}"
         if request.params:
             msg += f" - params {request.params}"
@@ -150,11 +372,11 @@ class HttpXClient(BaseClient):
         if request.json_data:
             msg += f" - json data {request.json_data}"
         logger.debug(msg)
-        return Response(
+        return Response.from_trusted(
             request=request,
             text=response.text,
             data=data,
-            url=HttpUrl(str(response.url)),
+            url=str(response.url),
             headers=dict(response.headers),
         )
 
@@ -279,10 +501,10 @@ class PlaywrightClient(BaseClient):
             page.on("request", lambda pw_request: self._intercept_requests(pw_request))
 
         try:
-            logger.debug(f"Requesting {request.url_encoded}")
+            logger.debug(f"Requesting {request.url}")
             # Playwright page.goto() timeout is in milliseconds
             pw_response = await page.goto(request.url, timeout=request.timeout * 1000)
-            logger.debug(f"Received response for {request.url_encoded}")
+            logger.debug(f"Received response for {request.url}")
             self._raise_for_status(pw_response.status, pw_response.status_text)
 
             if self.actions is not None:
@@ -366,10 +588,10 @@ class PlaywrightInterceptClient(PlaywrightClient):
         page.on("request", lambda pw_request: self._intercept_requests(pw_request))
         responses = []
         try:
-            logger.debug(f"Requesting {request.url_encoded}")
+            logger.debug(f"Requesting {request.url}")
             # Playwright page.goto() timeout is in milliseconds
             pw_response = await page.goto(request.url, timeout=request.timeout * 1000)
-            logger.debug(f"Received response for {request.url_encoded}")
+            logger.debug(f"Received response for {request.url}")
             self._raise_for_status(pw_response.status, pw_response.status_text)
 
             if self.actions is not None:
@@ -20,6 +20,17 @@ class RetryConfig(BaseModel):
     wait_exp_max: PositiveInt = 10
     wait_exp_min: PositiveInt = 4
     wait_exp_mul: PositiveInt = 1
+    wait_strategy: Literal["decorrelated_jitter", "exponential"] = Field(
+        default="decorrelated_jitter",
+        description="How to wait between attempts. Decorrelated jitter waits a random time between wait_exp_min,"
+        " or wait_exp_mul if greater, and three times the previous wait, capped at wait_exp_max,"
+        " so that concurrent retries don't synchronize."
+        " Exponential waits wait_exp_mul * 2 ** attempt, bounded by wait_exp_min and wait_exp_max.",
+    )
+    seed: Optional[int] = Field(
+        default=None,
+        description="The seed of the random wait generator, to make decorrelated jitter reproducible.",
+    )
 
 
 class RateLimiterConfig(BaseModel):
@@ -94,6 +105,22 @@ class DelayConfig(BaseModel):
         return random.randint(0, self.amount) / 1000
 
 
+class BloomFilterConfig(BaseModel):
+    """Bloom filter configuration for request deduplication."""
+
+    capacity: PositiveInt = Field(
+        default=1_000_000,
+        gt=0,
+        description="The expected number of unique requests.",
+    )
+    error_rate: float = Field(
+        default=0.001,
+        gt=0,
+        lt=1,
+        description="The probability of skipping a unique request as a duplicate, once capacity is reached.",
+    )
+
+
 class ServiceConfig(BaseModel):
     """Global configuration for the service."""
 
@@ -103,10 +130,22 @@ class ServiceConfig(BaseModel):
     deduplication: bool = Field(
         default=True, description="Whether to deduplicate requests."
     )
+    bloom_filter: BloomFilterConfig | None = Field(
+        description="The Bloom filter configuration. If set, requests are deduplicated with a Bloom filter"
+        " of bounded memory instead of a set of unique keys, at the cost of rare false positives.",
+        default=None,
+    )
     max_concurrency: PositiveInt = Field(
         default=10, description="The maximum number of concurrent requests."
     )
 
+    response_cache_size: PositiveInt = Field(
+        default=0,
+        description="The number of responses kept in memory, so that identical requests are not made again."
+        " Concurrent identical requests share a single request regardless, unless deduplication is disabled."
+        " Defaults to 0, i.e. no responses are kept.",
+    )
+
     limiter: RateLimiterConfig | None = Field(
         description="The rate limiter configuration", default=None
     )
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import urllib.parse
+from functools import cached_property
 from typing import (
+    TYPE_CHECKING,
     Annotated,
     Any,
     Awaitable,
     Callable,
     Iterator,
     Literal,
+    Mapping,
     Optional,
+    Self,
     TypedDict,
     Union,
 )
 
-from bs4 import BeautifulSoup
 from pydantic import (
     AfterValidator,
     BaseModel,
@@ -29,6 +34,37 @@ from pydantic import (
 from dataservice._utils import _get_func_name
 from dataservice.config import ProxyConfig
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    LexborHTMLParser = None
+    SELECTOLAX_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from lxml import etree
+
+
+ParserType = Literal["lxml", "html.parser", "html5lib"]
+
+
+def _is_available(parser: ParserType) -> bool:
+    """Check whether the module backing a BeautifulSoup parser can be imported."""
+    return parser == "html.parser" or importlib.util.find_spec(parser) is not None
+
+
+# The parsers to default to, fastest first. html5lib is only a last resort.
+_PREFERRED_PARSERS: tuple[ParserType, ...] = ("lxml", "html.parser")
+_DEFAULT_PARSER: ParserType = next(
+    (parser for parser in _PREFERRED_PARSERS if _is_available(parser)),
+    "html5lib",
+)
+
+# The cached properties of Request, computed from its fields.
+_REQUEST_CACHED_PROPERTIES = ("unique_key", "url_encoded")
+
 GenericDataItem = dict[Any, Any] | BaseModel
 RequestOrData = Union["Request", GenericDataItem]
 CallbackReturn = Iterator[RequestOrData] | RequestOrData
@@ -55,6 +91,10 @@ class Request(BaseModel):
     content_type: Literal["text", "json"] = Field(
         description="The content type of the request.", default="text"
     )
+    parser: ParserType = Field(
+        description="The BeautifulSoup parser used to parse the text of the response.",
+        default=_DEFAULT_PARSER,
+    )
     headers: Optional[dict] = Field(
         description="The headers of the request.", default=None
     )
@@ -76,8 +116,33 @@ class Request(BaseModel):
     timeout: int = Field(
         description="The time out of the request.", default=30, ge=1, le=300
     )
+    cache: Optional[bool] = Field(
+        description="Whether the worker can reuse the response of an identical request, in flight or cached."
+        " Defaults to None, i.e. only for GET requests.",
+        default=None,
+    )
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, ignored_types=(cached_property,)
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self._clear_cached_properties()
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the request, recomputing its cached properties if fields are updated."""
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy._clear_cached_properties()
+        return copy
+
+    def _clear_cached_properties(self) -> None:
+        """Clear the cached properties, so that they are computed again from the current fields."""
+        for name in _REQUEST_CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
 
     @model_validator(mode="after")
     def validate(self) -> Request:  # type: ignore
@@ -87,6 +152,19 @@ class Request(BaseModel):
             raise ValueError("GET requests cannot have form data or json data.")
         return self
 
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> Request:
+        """Create a request from values that are known to be valid, skipping validation.
+
+        Useful in callbacks yielding many requests whose values are already valid,
+        e.g. a URL joined from the URL of a validated request. The URL is used as is, without normalization.
+        Use the default constructor for user supplied values.
+
+        :param fields: The fields of the request.
+        :return: The request object.
+        """
+        return cls.model_construct(**fields)
+
     @model_serializer
     def ser_model(self) -> dict[str, Any]:
         model = {}
@@ -105,9 +183,9 @@ class Request(BaseModel):
     def client_name(self) -> str:
         return _get_func_name(self.client)
 
-    @property
+    @cached_property
     def unique_key(self) -> str:
-        """Return a unique key for the request."""
+        """Return a unique key for the request, computed on first access."""
         key = f"{self.method} {self.url}"
         if self.params:
             key += f" {self.params}"
@@ -117,9 +195,9 @@ class Request(BaseModel):
             key += f" {self.json_data}"
         return key
 
-    @property
+    @cached_property
     def url_encoded(self) -> HttpUrl:
-        """Return the URL encoded."""
+        """Return the URL encoded, computed on first access."""
         url = str(self.url)
         if "?" in url or not self.params:
             return HttpUrl(url)
@@ -162,24 +240,122 @@ class Response(BaseModel):
     data: dict | list[dict] | None = Field(
         description="The data of the response.", default=None
     )
-    __html: BeautifulSoup | None = None
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, ignored_types=(cached_property,)
+    )
+
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> Response:
+        """Create a response from values that are known to be valid, skipping validation.
+
+        Used by the HTTPX client, which builds the response from values already parsed by httpx.
+        The URL must be passed as a normalized string, e.g. ``str(httpx.URL)``.
+
+        :param fields: The fields of the response.
+        :return: The response object.
+        """
+        return cls.model_construct(**fields)
+
+    def for_request(self, request: Request) -> Response:
+        """Return a copy of a shared response, attached to the request it is returned for.
+
+        :param request: The request object the response is returned for.
+        :return: A Response object.
+        """
+        return type(self).model_construct(**{**dict(self), "request": request})
 
     @property
     def client(self) -> ClientCallable:
+        """Return the client of the request that generated the response.
+
+        Pass it to the requests yielded by a callback, so that they share the connection pool of the client
+        instead of opening new connections.
+        """
         return self.request.client
 
-    @property
+    @cached_property
     def html(self) -> BeautifulSoup:
         """Return the BeautifulSoup object of the response, if the initial request asked for text data."""
         if self.request.content_type == "json":
             raise ValueError(
                 "Cannot create BeautifulSoup object when the Request content type is JSON."
             )
-        if self.__html is None:
-            self.__html = BeautifulSoup(self.text, "html5lib")
-        return self.__html
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(self.text, self.request.parser)
+
+    async def async_html(self) -> BeautifulSoup:
+        """Return the ``html`` property, parsing the text in a separate thread if not parsed yet.
+        Use it in coroutine callbacks, which run in the event loop, to avoid blocking it while parsing.
+        """
+        return await asyncio.to_thread(getattr, self, "html")
+
+    @cached_property
+    def tree(self) -> LexborHTMLParser:
+        """Return the selectolax Lexbor parser of the response, if the initial request asked for text data."""
+        if self.request.content_type == "json":
+            raise ValueError(
+                "Cannot create LexborHTMLParser object when the Request content type is JSON."
+            )
+        if not SELECTOLAX_AVAILABLE:
+            raise ImportError(
+                "Selectolax optional dependency is not installed. Please install it with `pip install python-dataservice[selectolax]`."
+            )
+        return LexborHTMLParser(self.text)
+
+    def iterparse(
+        self, tag: str, class_name: Optional[str] = None, chunk_size: int = 65536
+    ) -> Iterator[etree._Element]:
+        """Incrementally parse the text of the response and yield the elements with the given tag and class.
+
+        Unlike ``html``, the whole document tree is never held in memory: once the iteration moves on, each element
+        is cleared and the elements before it and before its ancestors are discarded, so the elements must be
+        processed within the loop. Elements nested in an element with the same tag are kept until the outer one ends.
+
+        :Example:
+
+        .. code-block:: python
+
+            for article in response.iterparse("article", class_name="product_pod"):
+                href = article.find(".//h3/a").get("href")
+
+        :param tag: The tag of the elements to yield.
+        :param class_name: Optional class the elements must have.
+        :param chunk_size: The number of characters fed to the parser at a time.
+        :return: An iterator of lxml elements.
+        """
+        if self.request.content_type == "json":
+            raise ValueError(
+                "Cannot parse HTML elements when the Request content type is JSON."
+            )
+        from lxml import etree
+
+        parser = etree.HTMLPullParser(events=("end",), tag=tag)
+        for start in range(0, len(self.text), chunk_size):
+            parser.feed(self.text[start : start + chunk_size])
+            yield from self._read_elements(parser, class_name)
+        parser.close()
+        yield from self._read_elements(parser, class_name)
+
+    @staticmethod
+    def _read_elements(
+        parser: etree.HTMLPullParser, class_name: Optional[str]
+    ) -> Iterator[etree._Element]:
+        """Yield the parsed elements matching the class, clearing them and the elements before them afterwards."""
+        for _, element in parser.read_events():
+            if class_name is None or class_name in element.get("class", "").split():
+                yield element
+            # The content of an enclosing element with the same tag is still to be yielded
+            if next(element.iterancestors(element.tag), None) is not None:
+                continue
+            element.clear(keep_tail=True)
+            for node in (element, *element.iterancestors()):
+                parent = node.getparent()
+                if parent is None:
+                    break
+                while node.getprevious() is not None:
+                    del parent[0]
 
 
 class InterceptResponse(Response):
@@ -192,3 +368,9 @@ class FailedRequest(TypedDict):
     request: Request
     message: str
     exception: str
+
+
+# Resolve the forward reference to ``Response`` in ``CallbackType`` once at import,
+# rather than on the first ``Request`` construction.
+Request.model_rebuild()
+InterceptRequest.model_rebuild()
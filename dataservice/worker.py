@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import inspect
 import logging
-from collections import abc
+import math
+import random
+import urllib.parse
+from collections import OrderedDict, abc
 from contextlib import nullcontext
-from typing import Any, AsyncGenerator, Generator, Iterable
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    cast,
+)
 
+import orjson
 from aiolimiter import AsyncLimiter
 from pydantic import BaseModel
 from tenacity import (
@@ -19,7 +33,7 @@ from tenacity import (
 )
 
 from dataservice.cache import AsyncCache, cache_request
-from dataservice.config import ServiceConfig
+from dataservice.config import BloomFilterConfig, ServiceConfig
 from dataservice.exceptions import (
     DataServiceException,
     NonRetryableException,
@@ -36,14 +50,139 @@ from dataservice.models import (
 
 logger = logging.getLogger(__name__)
 
+_EXHAUSTED = object()
+
+
+def _wait_decorrelated_jitter(
+    base: float, cap: float, rng: random.Random
+) -> Callable[[RetryCallState], float]:
+    """
+    Returns a tenacity wait strategy with decorrelated jitter:
+    each wait is drawn uniformly between ``base`` and three times the previous wait, capped at ``cap``.
+
+    :param base: The minimum wait in seconds, also used as the first previous wait.
+    :param cap: The maximum wait in seconds.
+    :param rng: The random generator to draw the waits from.
+    :return: The wait function.
+    """
+
+    def _wait(retry_state: RetryCallState) -> float:
+        # Until the first wait is computed, tenacity's upcoming_sleep is 0
+        previous = retry_state.upcoming_sleep or base
+        return min(cap, rng.uniform(base, previous * 3))
+
+    return _wait
+
+
+def _canonical_key(request: Request) -> tuple[int, str]:
+    """
+    Returns a key identifying the response of a request, normalizing the parts of the URL that don't change it.
+    The scheme and host are lowercased, the query parameters, including ``params``, are sorted and the body,
+    headers, cookies and proxy are hashed. Requests made with different clients never share a key.
+
+    :param request: The request to compute the key for.
+    :return: The identity of the client and the canonical key.
+    """
+    parts = urllib.parse.urlsplit(str(request.url))
+    query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    if request.params:
+        query.extend((str(k), str(v)) for k, v in request.params.items())
+    url = urllib.parse.urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path,
+            urllib.parse.urlencode(sorted(query)),
+            "",
+        )
+    )
+    key = f"{request.method} {request.content_type} {url}"
+    extra = {
+        "form": request.form_data,
+        "json": request.json_data,
+        # Header names are case-insensitive
+        "headers": {str(k).lower(): v for k, v in (request.headers or {}).items()},
+        "cookies": request.cookies,
+        "proxy": request.proxy.url if request.proxy else None,
+    }
+    if any(extra.values()):
+        digest = hashlib.blake2b(
+            orjson.dumps(
+                extra,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            ),
+            digest_size=16,
+        )
+        key += f" {digest.hexdigest()}"
+    # Clients can be unhashable, e.g. dataclasses. The id is not reused while the key is in use,
+    # since the requests in flight or in the response cache hold a reference to their client.
+    return id(request.client), key
+
+
+class BloomFilter:
+    """
+    A fixed size, probabilistic set of keys.
+    Checking a key can return a false positive at the configured error rate, but never a false negative.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Initializes the Bloom filter, sizing the bit array and the number of hashes for the given capacity.
+
+        :param capacity: The expected number of keys.
+        :param error_rate: The false positive probability once capacity keys are added.
+        """
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    @classmethod
+    def from_config(cls, config: BloomFilterConfig) -> BloomFilter:
+        """
+        Creates a Bloom filter from its configuration.
+
+        :param config: The Bloom filter configuration.
+        :return: The Bloom filter.
+        """
+        return cls(config.capacity, config.error_rate)
+
+    def _indexes(self, key: str) -> Iterator[int]:
+        """
+        Yields the bit indexes of a key, derived from a single digest by double hashing.
+
+        :param key: The key to hash.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[i >> 3] & (1 << (i & 7)) for i in self._indexes(key))
+
+    def add_if_absent(self, key: str) -> bool:
+        """
+        Adds a key, checking whether it was already present in the same pass.
+
+        :param key: The key to add.
+        :return: True if the key was absent and has been added, False if it was (probably) present.
+        """
+        added = False
+        for i in self._indexes(key):
+            byte, mask = i >> 3, 1 << (i & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                added = True
+        return added
+
 
 class DataWorker:
     """
     A worker class to handle asynchronous data processing.
     """
 
-    _clients: dict[Any, Any] = {}
-
     def __init__(
         self,
         requests: Iterable[Request],
@@ -62,7 +201,19 @@ class DataWorker:
         self._data_queue: asyncio.Queue = asyncio.Queue()
         self._work_queue: asyncio.Queue = asyncio.Queue()
         self._failures: dict[str, FailedRequest] = {}
-        self._seen_requests: set = set()
+        self._retry_random = random.Random(self.config.retry.seed)
+        self._cache_lock = asyncio.Lock()
+        self._item_handlers: dict[type, str] = {
+            Request: "_handle_request_item",
+            dict: "_handle_data_item",
+        }
+        self._response_cache: OrderedDict[tuple[int, str], Response] = OrderedDict()
+        self._in_flight: dict[tuple[int, str], asyncio.Future] = {}
+        self._seen_requests: set[str] | BloomFilter = (
+            BloomFilter.from_config(self.config.bloom_filter)
+            if self.config.bloom_filter
+            else set()
+        )
         self._started: bool = False
         self._semaphore: asyncio.Semaphore = asyncio.Semaphore(
             self.config.max_concurrency
@@ -82,11 +233,13 @@ class DataWorker:
         """
         return self._started
 
-    async def _add_to_work_queue(self, item: Iterable[Request] | Request) -> None:
+    async def _add_to_work_queue(
+        self, item: Generator | AsyncGenerator | Request | GenericDataItem
+    ) -> None:
         """
         Adds an item to the work queue.
 
-        :param item: The item to add to the work queue.
+        :param item: The item to add to the work queue, either a callback generator or a single item.
         """
         await self._work_queue.put(item)
 
@@ -115,6 +268,18 @@ class DataWorker:
         """
         return self._data_queue.get_nowait()
 
+    def get_data_batch(self, size: int) -> list[GenericDataItem]:
+        """
+        Retrieve up to ``size`` data items from the data queue.
+
+        :param size: The maximum number of data items to retrieve.
+        :return: The data items, fewer than ``size`` if the data queue runs out.
+        """
+        batch: list[GenericDataItem] = []
+        while len(batch) < size and not self._data_queue.empty():
+            batch.append(self._data_queue.get_nowait())
+        return batch
+
     def has_no_more_data(self) -> bool:
         """
         Check if there are no more data items in the data queue.
@@ -155,18 +320,40 @@ class DataWorker:
 
     async def _handle_queue_item(self, item: Request | GenericDataItem) -> None:
         """
-        Handles an item from the work queue.
+        Handles an item from the work queue, dispatching it on its type.
 
         :param item: The item to handle from the work queue.
         """
-        if isinstance(item, Request):
-            logger.debug(f"Handling request {item.url}")
-            await self._handle_request_item(item)
-        elif isinstance(item, (abc.MutableMapping, BaseModel)):
-            logger.debug("Handling data item")
-            await self._add_to_data_queue(item)
+        handler = self._item_handlers.get(type(item)) or self._get_item_handler(
+            type(item)
+        )
+        await getattr(self, handler)(item)
+
+    def _get_item_handler(self, item_type: type) -> str:
+        """
+        Finds the name of the handler method of an item type not dispatched yet, and caches it.
+
+        :param item_type: The type of the item.
+        :return: The name of the handler method.
+        :raises ValueError: If the item type is not supported.
+        """
+        if issubclass(item_type, Request):
+            handler = "_handle_request_item"
+        elif issubclass(item_type, (abc.MutableMapping, BaseModel)):
+            handler = "_handle_data_item"
         else:
-            raise ValueError(f"Unknown item type {type(item)}")
+            raise ValueError(f"Unknown item type {item_type}")
+        self._item_handlers[item_type] = handler
+        return handler
+
+    async def _handle_data_item(self, item: GenericDataItem) -> None:
+        """
+        Handles a data item.
+
+        :param item: The data item to handle.
+        """
+        logger.debug("Handling data item")
+        await self._add_to_data_queue(item)
 
     def _is_duplicate_request(self, request: Request) -> bool:
         """
@@ -176,11 +363,14 @@ class DataWorker:
         :return: True if the request is a duplicate, False otherwise.
         """
         key = request.unique_key
-        if key in self._seen_requests:
+        if isinstance(self._seen_requests, BloomFilter):
+            is_duplicate = not self._seen_requests.add_if_absent(key)
+        else:
+            is_duplicate = key in self._seen_requests
+            self._seen_requests.add(key)
+        if is_duplicate:
             logger.debug(f"Skipping duplicate request {request.url}")
-            return True
-        self._seen_requests.add(key)
-        return False
+        return is_duplicate
 
     def _has_request_failed(self, request: Request) -> bool:
         """
@@ -197,6 +387,7 @@ class DataWorker:
 
         :param request: The request item to handle.
         """
+        logger.debug(f"Handling request {request.url}")
         if self.config.deduplication and self._is_duplicate_request(request):
             return
         if self._has_request_failed(request):
@@ -250,13 +441,23 @@ class DataWorker:
     async def _handle_callback(self, request, response):
         """
         Handles the callback function of a request.
+        Synchronous callbacks run in a separate thread, so that parsing doesn't block the event loop.
+        Generator callbacks are advanced in a separate thread too, lazily, by the workers.
+        Coroutine callbacks are awaited in the event loop, and async generator callbacks are consumed in it.
 
         :param request: The request object.
         :param response: The response object.
         :return: The result of the callback function.
         """
         try:
-            return await asyncio.to_thread(request.callback, response)
+            if inspect.iscoroutinefunction(request.callback):
+                return await request.callback(response)
+            if inspect.isasyncgenfunction(request.callback):
+                return request.callback(response)
+            result = await asyncio.to_thread(request.callback, response)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
         except Exception as e:
             logger.error(f"Error processing callback {request.callback_name}: {e}")
             raise ParsingException(
@@ -266,6 +467,70 @@ class DataWorker:
     async def _handle_request(self, request: Request) -> Response:
         """
         Makes an asynchronous request with retry mechanism.
+        Responses can be reused for identical requests, i.e. with the same canonical key, if ``request.cache`` is set,
+        or by default for GET requests. Concurrent identical requests then share a single request,
+        unless deduplication is disabled, and responses are kept in an in-memory LRU cache of ``response_cache_size``.
+
+        :param request: The request object.
+        :return: The response object.
+        """
+        cache = request.method == "GET" if request.cache is None else request.cache
+        if not cache:
+            return await self._retry_request(request)
+
+        key = _canonical_key(request)
+        if key in self._response_cache:
+            logger.debug(f"Response cache hit for {request.url}")
+            self._response_cache.move_to_end(key)
+            return self._response_cache[key].for_request(request)
+        if self.config.deduplication:
+            response = await self._share_request(key, request)
+        else:
+            # Duplicate requests are meant to be sent, even when they are concurrent
+            response = await self._retry_request(request)
+        if self.config.response_cache_size > 0 and isinstance(response, Response):
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > self.config.response_cache_size:
+                self._response_cache.popitem(last=False)
+        return response
+
+    async def _share_request(self, key: tuple[int, str], request: Request) -> Response:
+        """
+        Makes the request, or awaits the response of the identical request already in flight.
+
+        :param key: The canonical key of the request.
+        :param request: The request object.
+        :return: The response object.
+        """
+        if key in self._in_flight:
+            logger.debug(f"Awaiting in-flight request for {request.url}")
+            response = await asyncio.shield(self._in_flight[key])
+            if isinstance(response, Response):
+                return response.for_request(request)
+            return response
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await self._retry_request(request)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, in case no identical request is waiting for it
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            del self._in_flight[key]
+
+    async def _retry_request(self, request: Request) -> Response:
+        """
+        Makes the request, retrying it on retryable exceptions.
 
         :param request: The request object.
         :return: The response object.
@@ -298,11 +563,7 @@ class DataWorker:
             retryer = AsyncRetrying(
                 reraise=True,
                 stop=stop_after_attempt(self.config.retry.max_attempts),
-                wait=wait_exponential(
-                    multiplier=self.config.retry.wait_exp_mul,
-                    min=self.config.retry.wait_exp_min,
-                    max=self.config.retry.wait_exp_max,
-                ),
+                wait=self._retry_wait(),
                 retry=retry_if_exception_type((RetryableException, TimeoutException)),
                 before_sleep=before_sleep_log(logger),
                 after=after_log(logger),
@@ -311,6 +572,23 @@ class DataWorker:
 
         return await _wrap_retry(request)
 
+    def _retry_wait(self) -> Callable[[RetryCallState], float]:
+        """
+        Returns the wait strategy between retries, according to the retry configuration.
+
+        :return: The tenacity wait function.
+        """
+        retry = self.config.retry
+        if retry.wait_strategy == "exponential":
+            return wait_exponential(
+                multiplier=retry.wait_exp_mul,
+                min=retry.wait_exp_min,
+                max=retry.wait_exp_max,
+            )
+        # The first exponential wait is wait_exp_mul, so that a wait_exp_min of 0 doesn't mean retrying at once
+        base = max(retry.wait_exp_min, retry.wait_exp_mul)
+        return _wait_decorrelated_jitter(base, retry.wait_exp_max, self._retry_random)
+
     async def _make_request(self, request) -> Response:
         """
         Wraps client call. This is the actual request function. If cache is enabled, it will cache the request.
@@ -325,25 +603,46 @@ class DataWorker:
             await asyncio.sleep(self.config.delay.get())
             return await request.client(request)
 
-    async def _iter_callbacks(
-        self, callback: Generator | AsyncGenerator | Request | GenericDataItem
-    ) -> AsyncGenerator[asyncio.Task, None]:
+    async def _handle_work_item(
+        self, item: Generator | AsyncGenerator | Request | GenericDataItem
+    ) -> None:
         """
-        Iterates over callbacks and creates tasks for them.
+        Handles an item from the work queue.
+        Callback generators are consumed lazily, one item at a time: the generator is put back in the work queue
+        before its next item is handled, so that idle workers can pull the following items concurrently.
 
-        :param callback: Either a callback iterator or a single result
-        :return: An async generator of tasks.
+        :param item: Either a callback generator or a single result.
         """
-        if isinstance(callback, abc.Generator):
-            for item in callback:
-                yield asyncio.create_task(self._handle_queue_item(item))
-        elif isinstance(callback, abc.AsyncGenerator):
-            async for item in callback:
-                yield asyncio.create_task(self._handle_queue_item(item))
-        elif isinstance(callback, (Request, abc.MutableMapping, BaseModel)):
-            yield asyncio.create_task(self._handle_queue_item(callback))
+        if isinstance(item, abc.Generator):
+            # The body of a generator callback, where the parsing happens, runs as it is advanced
+            child = await asyncio.to_thread(next, item, _EXHAUSTED)
+        elif isinstance(item, abc.AsyncGenerator):
+            child = await anext(item, _EXHAUSTED)
         else:
-            raise ValueError(f"Unknown item type {type(callback)}")
+            await self._handle_queue_item(item)
+            return
+        if child is _EXHAUSTED:
+            return
+        await self._add_to_work_queue(item)
+        await self._handle_queue_item(cast(Request | GenericDataItem, child))
+
+    async def _worker_loop(self, cache: AsyncCache | None) -> None:
+        """
+        Handles items from the work queue until cancelled.
+
+        :param cache: The cache entered by fetch, if any.
+        """
+        while True:
+            item = await self._work_queue.get()
+            try:
+                await self._handle_work_item(item)
+                if self.config.cache.use and self.config.cache.write_periodically:
+                    async with self._cache_lock:
+                        await cache.write_periodically(  # type: ignore
+                            self.config.cache.write_interval
+                        )
+            finally:
+                self._work_queue.task_done()
 
     async def fetch(self) -> None:
         """
@@ -352,28 +651,27 @@ class DataWorker:
         if not self._started:
             await self._enqueue_start_requests()
         async with self.cache as cache:
-            while self.has_jobs():
-                logger.debug(f"Work queue size: {self._work_queue.qsize()}")
-                logger.debug(f"Data queue size: {self._data_queue.qsize()}")
-                items = []
-                for _ in range(
-                    min(self.config.max_concurrency, self._work_queue.qsize())
-                ):
-                    items.append(self._work_queue.get_nowait())
-
-                tasks = []
-                for item in items:
-                    async for task in self._iter_callbacks(item):
-                        tasks.append(task)
-
-                        # Process batch when it reaches the max concurrency limit
-                        if len(tasks) >= self.config.max_concurrency:
-                            await asyncio.gather(*tasks)
-                            tasks = []
-
-                # Process any remaining tasks that didn’t fill a full batch
-                if tasks:
-                    await asyncio.gather(*tasks)
+            await self._process_work_queue(cache)
 
-                if self.config.cache.use and self.config.cache.write_periodically:
-                    await cache.write_periodically(self.config.cache.write_interval)
+    async def _process_work_queue(self, cache: AsyncCache | None) -> None:
+        """
+        Processes the work queue with a pool of ``max_concurrency`` workers, until all the jobs are done.
+        If a worker fails, the exception is raised and the other workers are cancelled.
+
+        :param cache: The cache entered by fetch, if any.
+        """
+        workers = [
+            asyncio.create_task(self._worker_loop(cache))
+            for _ in range(max(1, self.config.max_concurrency))
+        ]
+        all_done = asyncio.create_task(self._work_queue.join())
+        try:
+            done, _ = await asyncio.wait(
+                [all_done, *workers], return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()
+        finally:
+            for task in (all_done, *workers):
+                task.cancel()
+            await asyncio.gather(all_done, *workers, return_exceptions=True)
@@ -1,3 +1,4 @@
+import argparse
 import logging
 
 from dataservice import (
@@ -25,7 +26,7 @@ def paginate(response: Response):
     pages = response.data["pages"]
     yield from parse_users(response)
     for p in range(2, pages + 1):
-        yield Request(
+        yield Request.from_trusted(
             url=response.request.url,
             callback=parse_users,
             client=response.request.client,
@@ -34,7 +35,7 @@ def paginate(response: Response):
         )
 
 
-def main():
+def main(concurrency: int):
     httpx_client = HttpXClient()
     start_requests = [
         Request(
@@ -45,7 +46,10 @@ def main():
         )
     ]
     data_service = DataService(
-        start_requests, config=ServiceConfig(**{"limiter": {"max_rate": 10}})
+        start_requests,
+        config=ServiceConfig(
+            **{"limiter": {"max_rate": 10}, "max_concurrency": concurrency}
+        ),
     )
     data = tuple(data_service)
     for item in data:
@@ -53,4 +57,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of requests in flight at the same time",
+    )
+    args = args_parser.parse_args()
+    main(args.concurrency)
@@ -38,26 +38,29 @@ def parse_books_page(
     response: Response, pagination: bool = False
 ) -> Iterator[BooksPage | Request]:
     """Parse the books page."""
-    articles = response.html.find_all("article", {"class": "product_pod"})
+    articles = response.tree.css("article.product_pod")
+    base_url = response.request.url
 
     yield BooksPage(
         **{
-            "url": response.request.url,
-            "title": lambda: response.html.title.get_text(strip=True),
+            "url": base_url,
+            "title": lambda: response.tree.css_first("title").text(strip=True),
             "books": len(articles),
         }
     )
 
     for article in articles:
-        href = article.h3.a["href"]
-        url = urljoin(response.request.url, href)
-        yield Request(url=url, callback=parse_book_details, client=response.client)
+        href = article.css_first("h3 a").attributes["href"]
+        url = urljoin(base_url, href)
+        yield Request.from_trusted(
+            url=url, callback=parse_book_details, client=response.client
+        )
 
     if pagination:
-        next_page = response.html.find("li", {"class": "next"})
+        next_page = response.tree.css_first("li.next a")
         if next_page is not None:
-            next_page_url = urljoin(response.request.url, next_page.a["href"])
-            yield Request(
+            next_page_url = urljoin(base_url, next_page.attributes["href"])
+            yield Request.from_trusted(
                 url=next_page_url,
                 callback=lambda resp: parse_books_page(resp, pagination=pagination),
                 client=response.client,
@@ -68,14 +71,14 @@ def parse_book_details(response: Response) -> BookDetails:
     """Parse the book details."""
     return BookDetails(
         **{
-            "title": lambda: response.html.find("h1").text,
-            "price": lambda: response.html.find("p", {"class": "price_color"}).text,
+            "title": lambda: response.tree.css_first("h1").text(),
+            "price": lambda: response.tree.css_first("p.price_color").text(),
             "url": response.url,
         }
     )
 
 
-def main(pagination: bool):
+def main(pagination: bool, concurrency: int):
     httpx_client = HttpXClient()
     start_requests = [
         Request(
@@ -84,7 +87,9 @@ def main(pagination: bool):
             client=httpx_client,
         )
     ]
-    service_config = ServiceConfig(delay={"amount": 10000}, cache={"use": True})
+    service_config = ServiceConfig(
+        delay={"amount": 10000}, cache={"use": True}, max_concurrency=concurrency
+    )
     data_service = DataService(start_requests, service_config)
     data = defaultdict(list)
     for item in data_service:
@@ -100,6 +105,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable pagination to scrape multiple pages",
     )
+    args_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of requests in flight at the same time",
+    )
     args = args_parser.parse_args()
-    elapsed = timeit.timeit(lambda: main(args.pagination), number=1)
+    elapsed = timeit.timeit(lambda: main(args.pagination, args.concurrency), number=1)
     pprint("Elapsed time: {:.2f} seconds".format(elapsed))
@@ -6,6 +6,8 @@ from logging import getLogger
 from typing import Iterator
 from urllib.parse import urljoin
 
+import soupsieve as sv
+
 from dataservice import (
     AsyncDataService,
     BaseDataItem,
@@ -19,6 +21,12 @@ from dataservice import (
 logger = getLogger("books_scraper")
 setup_logging("books_scraper")
 
+# Compile the CSS selectors once, instead of on every callback invocation.
+_ARTICLE_SEL = sv.compile("article.product_pod")
+_NEXT_SEL = sv.compile("li.next > a")
+_H1_SEL = sv.compile("h1")
+_PRICE_SEL = sv.compile("p.price_color")
+
 
 class BooksPage(BaseDataItem):
     url: str
@@ -34,11 +42,12 @@ class BookDetails(BaseDataItem):
 
 def parse_books_page(response: Response) -> Iterator[BooksPage | Request]:
     """Parse the books page."""
-    articles = response.html.find_all("article", {"class": "product_pod"})
+    articles = _ARTICLE_SEL.select(response.html)
+    base_url = response.request.url
 
     yield BooksPage(
         **{
-            "url": response.request.url,
+            "url": base_url,
             "title": lambda: response.html.title.get_text(strip=True),
             "books": len(articles),
         }
@@ -46,12 +55,12 @@ def parse_books_page(response: Response) -> Iterator[BooksPage | Request]:
 
     for article in articles:
         href = article.h3.a["href"]
-        url = urljoin(response.request.url, href)
+        url = urljoin(base_url, href)
         yield Request(url=url, callback=parse_book_details, client=response.client)
 
-    next_page = response.html.find("li", {"class": "next"})
+    next_page = _NEXT_SEL.select_one(response.html)
     if next_page is not None:
-        next_page_url = urljoin(response.request.url, next_page.a["href"])
+        next_page_url = urljoin(base_url, next_page["href"])
         yield Request(
             url=next_page_url,
             callback=parse_books_page,
@@ -63,8 +72,8 @@ def parse_book_details(response: Response) -> BookDetails:
     """Parse the book details."""
     return BookDetails(
         **{
-            "title": lambda: response.html.find("h1").text,
-            "price": lambda: response.html.find("p", {"class": "price_color"}).text,
+            "title": lambda: _H1_SEL.select_one(response.html).text,
+            "price": lambda: _PRICE_SEL.select_one(response.html).text,
             "url": response.url,
         }
     )
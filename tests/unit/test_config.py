@@ -36,6 +36,8 @@ def test_retry_config_invalid_values():
         RetryConfig(wait_exp_min=-1)
     with pytest.raises(ValidationError):
         RetryConfig(wait_exp_mul=-1)
+    with pytest.raises(ValidationError):
+        RetryConfig(wait_strategy="linear")
 
 
 def test_service_config_defaults():
@@ -44,6 +46,8 @@ def test_service_config_defaults():
     assert config.max_concurrency == 10
     assert config.delay.amount == 0.0
     assert config.retry.max_attempts == 3
+    assert config.bloom_filter is None
+    assert config.response_cache_size == 0
 
 
 def test_service_config_custom_values():
@@ -67,6 +71,10 @@ def test_service_config_invalid_values():
         ServiceConfig(max_concurrency=-1)
     with pytest.raises(ValidationError):
         ServiceConfig(delay={"amount": -1})
+    with pytest.raises(ValidationError):
+        ServiceConfig(bloom_filter={"capacity": 0})
+    with pytest.raises(ValidationError):
+        ServiceConfig(bloom_filter={"error_rate": 1})
 
 
 @pytest.fixture
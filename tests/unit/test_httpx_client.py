@@ -1,10 +1,13 @@
+import asyncio
+import gzip
+
 import pytest
-from httpx import HTTPError, HTTPStatusError
+from httpx import AsyncClient, HTTPError, HTTPStatusError
 from httpx import Response as HttpXResponse
 from httpx import TimeoutException as HTTPXTimeoutException
-from pytest_httpx import HTTPXMock
+from pytest_httpx import HTTPXMock, IteratorStream
 
-from dataservice.clients import HttpXClient
+from dataservice.clients import AdaptiveConcurrencyLimiter, HttpXClient
 from dataservice.exceptions import (
     DataServiceException,
     RetryableException,
@@ -173,3 +176,241 @@ async def test_follow_redirects(httpx_mock, httpx_client):
     assert response.request.url == "https://example.com/"
     assert response.url == "https://example.com/redirected"
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_reuses_async_client(httpx_mock, httpx_client):
+    httpx_mock.add_response(url="https://example.com/", text="first")
+    httpx_mock.add_response(url="https://example.com/", text="second")
+    request = Request(
+        url="https://example.com", callback=lambda x: x, client=HttpXClient
+    )
+    await httpx_client.make_request(request)
+    first = httpx_client._get_client(request)
+    await httpx_client.make_request(request)
+    assert httpx_client._get_client(request) is first
+    assert len(httpx_client._clients) == 1
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_aclose(httpx_mock, httpx_client):
+    httpx_mock.add_response(url="https://example.com/")
+    request = Request(
+        url="https://example.com", callback=lambda x: x, client=HttpXClient
+    )
+    await httpx_client.make_request(request)
+    client = httpx_client._get_client(request)
+    await httpx_client.aclose()
+    assert client.is_closed
+    assert httpx_client._clients == {}
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_async_context_manager(httpx_mock):
+    httpx_mock.add_response(url="https://example.com/")
+    request = Request(
+        url="https://example.com", callback=lambda x: x, client=HttpXClient
+    )
+    async with HttpXClient() as httpx_client:
+        await httpx_client.make_request(request)
+        client = httpx_client._get_client(request)
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_with_injected_client(httpx_mock):
+    httpx_mock.add_response(url="https://example.com/", text="injected")
+    async with AsyncClient(follow_redirects=True) as async_client:
+        httpx_client = HttpXClient(client=async_client)
+        request = Request(
+            url="https://example.com", callback=lambda x: x, client=httpx_client
+        )
+        response = await httpx_client.make_request(request)
+        assert response.text == "injected"
+        assert httpx_client._get_client(request) is async_client
+        assert httpx_client._clients == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "http2, expected_max_connections",
+    [
+        pytest.param(True, 20, id="HTTP/2"),
+        pytest.param(False, 100, id="HTTP/1.1"),
+    ],
+)
+async def test_httpx_client_http2(mocker, http2, expected_max_connections):
+    httpx_client = HttpXClient(http2=http2)
+    mocked_async_client = mocker.patch.object(httpx_client, "async_client")
+    request = Request(
+        url="https://example.com", callback=lambda x: x, client=HttpXClient
+    )
+    httpx_client._get_client(request)
+    kwargs = mocked_async_client.call_args.kwargs
+    assert kwargs["http2"] is http2
+    assert kwargs["limits"].max_connections == expected_max_connections
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_halves_limit_on_overload():
+    limiter = AdaptiveConcurrencyLimiter(8, min_concurrency=3)
+    for _ in range(2):
+        await limiter.acquire()
+        limiter.release(overloaded=True)
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_grows_limit_on_success():
+    limiter = AdaptiveConcurrencyLimiter(4)
+    await limiter.acquire()
+    limiter.release(overloaded=True)
+    assert limiter.limit == 2
+    for _ in range(2):
+        await limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 3
+    for _ in range(10):
+        await limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_caps_concurrency():
+    limiter = AdaptiveConcurrencyLimiter(2)
+    active, max_active = 0, 0
+
+    async def task():
+        nonlocal active, max_active
+        async with limiter:
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(task() for _ in range(6)))
+    assert max_active == 2
+
+
+def test_adaptive_limiter_invalid_bounds():
+    with pytest.raises(ValueError, match="min_concurrency must be between"):
+        AdaptiveConcurrencyLimiter(2, min_concurrency=3)
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_lowers_concurrency_on_429(httpx_mock):
+    httpx_client = HttpXClient(max_concurrency=10)
+    httpx_mock.add_response(url="https://example.com/", status_code=429)
+    request = Request(
+        url="https://example.com", callback=lambda x: x, client=HttpXClient
+    )
+    with pytest.raises(RetryableException):
+        await httpx_client.make_request(request)
+    assert httpx_client._concurrency.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_post_json_request(httpx_mock, httpx_client):
+    httpx_mock.add_response(
+        url="https://example.com/",
+        method="POST",
+        json={"response": "example"},
+        match_content=b'{"json":["data"]}',
+        match_headers={"Content-Type": "application/json", "X-Test": "test"},
+    )
+    request = Request(
+        url="https://example.com",
+        method="POST",
+        json_data={"json": ["data"]},
+        headers={"X-Test": "test"},
+        callback=lambda x: x,
+        content_type="json",
+        client=HttpXClient,
+    )
+    response = await httpx_client.make_request(request)
+    assert response.data == {"response": "example"}
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_post_json_request_with_non_str_keys(
+    httpx_mock, httpx_client
+):
+    httpx_mock.add_response(
+        url="https://example.com/",
+        method="POST",
+        match_content=b'{"1":"a"}',
+    )
+    request = Request(
+        url="https://example.com",
+        method="POST",
+        json_data={1: "a"},
+        callback=lambda x: x,
+        client=HttpXClient,
+    )
+    response = await httpx_client.make_request(request)
+    assert response.request is request
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_does_not_share_json_and_text_responses(
+    httpx_mock, httpx_client
+):
+    httpx_mock.add_response(url="https://example.com/", json={"key": "value"})
+    requests = [
+        Request(
+            url="https://example.com",
+            callback=lambda x: x,
+            client=HttpXClient,
+            content_type=content_type,
+        )
+        for content_type in ("json", "text")
+    ]
+    json_response, text_response = await asyncio.gather(
+        *(httpx_client.make_request(request) for request in requests)
+    )
+    assert json_response.data == {"key": "value"}
+    assert text_response.text == '{"key": "value"}'
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_does_not_share_responses_across_headers(
+    httpx_mock, httpx_client
+):
+    for token in ("a", "b"):
+        httpx_mock.add_response(
+            url="https://example.com/",
+            text=f"token {token}",
+            match_headers={"Authorization": f"Bearer {token}"},
+        )
+    requests = [
+        Request(
+            url="https://example.com",
+            callback=lambda x: x,
+            client=HttpXClient,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        for token in ("a", "b")
+    ]
+    responses = await asyncio.gather(
+        *(httpx_client.make_request(request) for request in requests)
+    )
+    assert [response.text for response in responses] == ["token a", "token b"]
+    assert [response.request for response in responses] == requests
+
+
+@pytest.mark.asyncio
+async def test_httpx_client_decompresses_responses(httpx_mock, httpx_client):
+    text = "<html><body>compressed</body></html>"
+    httpx_mock.add_response(
+        url="https://example.com/",
+        stream=IteratorStream([gzip.compress(text.encode())]),
+        headers={"Content-Encoding": "gzip"},
+    )
+    request = Request(
+        url="https://example.com/", callback=lambda x: x, client=httpx_client
+    )
+    response = await httpx_client.make_request(request)
+    assert response.text == text
+    assert "gzip" in httpx_mock.get_request().headers["Accept-Encoding"]
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from contextlib import nullcontext as does_not_raise
 from functools import partial, wraps
 
@@ -5,7 +7,13 @@ import pytest
 from bs4 import BeautifulSoup
 from pydantic import HttpUrl, ValidationError
 
-from dataservice.models import Request, Response
+from dataservice.models import (
+    _DEFAULT_PARSER,
+    InterceptRequest,
+    Request,
+    Response,
+    _is_available,
+)
 from tests.unit.conftest import ToyClient
 
 
@@ -83,9 +91,33 @@ def test_response_html_property(valid_request, valid_url):
     html_string = "<html><body><p>Hello, world!</p></body></html>"
     response = Response(request=valid_request, text=html_string, url=valid_url)
     assert isinstance(response.html, BeautifulSoup)
+    assert response.html is response.html
+    assert response.html.find("p").text == "Hello, world!"
+
+
+@pytest.mark.parametrize("parser", ["lxml", "html.parser", "html5lib"])
+def test_response_html_property_with_parser(valid_url, dummy_callback, parser):
+    if parser != "html.parser":
+        pytest.importorskip(parser)
+    request = Request(
+        url=valid_url, callback=dummy_callback, client=ToyClient(), parser=parser
+    )
+    html_string = "<html><body><p>Hello, world!</p></body></html>"
+    response = Response(request=request, text=html_string, url=valid_url)
     assert response.html.find("p").text == "Hello, world!"
 
 
+def test_request_default_parser(valid_request):
+    assert valid_request.parser == _DEFAULT_PARSER
+
+
+def test_is_available(mocker):
+    assert _is_available("lxml")
+    mocker.patch("dataservice.models.importlib.util.find_spec", return_value=None)
+    assert not _is_available("lxml")
+    assert _is_available("html.parser")
+
+
 def test_response_html_property_with_json_content_type(valid_data_request, valid_url):
     json_data = {"key": "value"}
     response = Response(request=valid_data_request, data=json_data, url=valid_url)
@@ -96,6 +128,33 @@ def test_response_html_property_with_json_content_type(valid_data_request, valid
         _ = response.html
 
 
+def test_response_tree_property(valid_request, valid_url):
+    lexbor = pytest.importorskip("selectolax.lexbor")
+    html_string = "<html><body><p class='greeting'>Hello, world!</p></body></html>"
+    response = Response(request=valid_request, text=html_string, url=valid_url)
+    assert isinstance(response.tree, lexbor.LexborHTMLParser)
+    assert response.tree is response.tree
+    assert response.tree.css_first("p.greeting").text() == "Hello, world!"
+
+
+def test_response_tree_property_with_json_content_type(valid_data_request, valid_url):
+    response = Response(
+        request=valid_data_request, data={"key": "value"}, url=valid_url
+    )
+    with pytest.raises(
+        ValueError,
+        match="Cannot create LexborHTMLParser object when the Request content type is JSON.",
+    ):
+        _ = response.tree
+
+
+def test_response_tree_property_without_selectolax(valid_request, valid_url, mocker):
+    mocker.patch("dataservice.models.SELECTOLAX_AVAILABLE", False)
+    response = Response(request=valid_request, text="<html></html>", url=valid_url)
+    with pytest.raises(ImportError, match="Selectolax optional dependency"):
+        _ = response.tree
+
+
 @pytest.mark.parametrize(
     "url, method, content_type, headers, params, form_data, json_data, client, context",
     [
@@ -381,3 +440,181 @@ def test_request_unique_key(method, params, form_data, json_data, expected_key):
 )
 def test_request_url_encoded(req, expected):
     assert req.url_encoded == expected
+
+
+def test_request_keys_are_cached(valid_request):
+    assert valid_request.unique_key is valid_request.unique_key
+    assert valid_request.url_encoded is valid_request.url_encoded
+    assert "unique_key" not in valid_request.model_dump()
+
+
+def test_request_keys_follow_field_assignment():
+    request = Request(
+        url="https://example.com", callback=lambda x: x, client=lambda x: x
+    )
+    assert request.unique_key == "GET https://example.com/"
+    assert request.url_encoded == HttpUrl("https://example.com/")
+    request.params = {"key1": "value1"}
+    assert request.unique_key == "GET https://example.com/ {'key1': 'value1'}"
+    assert request.url_encoded == HttpUrl("https://example.com/?key1=value1")
+
+
+def test_request_keys_follow_model_copy_update():
+    request = Request(
+        url="https://example.com", callback=lambda x: x, client=lambda x: x
+    )
+    assert request.unique_key == "GET https://example.com/"
+    other_request = request.model_copy(update={"url": "https://example.org/"})
+    assert other_request.unique_key == "GET https://example.org/"
+    assert other_request.url_encoded == HttpUrl("https://example.org/")
+    assert request.unique_key == "GET https://example.com/"
+
+
+def test_request_from_trusted():
+    callback, client = lambda x: x, lambda x: x
+    request = Request.from_trusted(
+        url="https://example.com/", callback=callback, client=client
+    )
+    assert request == Request(
+        url="https://example.com/", callback=callback, client=client
+    )
+    assert request.method == "GET"
+    assert request.timeout == 30
+    assert request.unique_key == "GET https://example.com/"
+
+
+def test_request_from_trusted_skips_validation():
+    request = Request.from_trusted(
+        url="https://example.com/",
+        callback=lambda x: x,
+        client=lambda x: x,
+        form_data={"key": "value"},
+    )
+    assert request.form_data == {"key": "value"}
+
+
+def test_response_client(valid_request, valid_url):
+    response = Response(request=valid_request, text="", url=valid_url)
+    assert response.client is valid_request.client
+
+
+def test_response_from_trusted(valid_request, valid_url):
+    response = Response.from_trusted(
+        request=valid_request, text="<p>Hello</p>", url=valid_url
+    )
+    assert response == Response(
+        request=valid_request, text="<p>Hello</p>", url=valid_url
+    )
+    assert response.status_code == 200
+    assert response.html.find("p").text == "Hello"
+
+
+@pytest.mark.parametrize("chunk_size", [16, 65536])
+def test_response_iterparse(valid_request, valid_url, chunk_size):
+    html_string = (
+        "<html><body>"
+        "<article class='product_pod'><h3><a href='a.html'>A</a></h3></article>"
+        "<article class='other'><h3><a href='b.html'>B</a></h3></article>"
+        "<article class='product_pod featured'><h3><a href='c.html'>C</a></h3></article>"
+        "</body></html>"
+    )
+    response = Response(request=valid_request, text=html_string, url=valid_url)
+    hrefs = [
+        article.find(".//h3/a").get("href")
+        for article in response.iterparse(
+            "article", class_name="product_pod", chunk_size=chunk_size
+        )
+    ]
+    assert hrefs == ["a.html", "c.html"]
+    assert len(list(response.iterparse("article"))) == 3
+
+
+def test_response_iterparse_clears_elements(valid_request, valid_url):
+    html_string = "<html><body><p>1</p><p>2</p></body></html>"
+    response = Response(request=valid_request, text=html_string, url=valid_url)
+    paragraphs = []
+    for p in response.iterparse("p"):
+        assert p.text is not None
+        paragraphs.append(p)
+    assert all(p.text is None for p in paragraphs)
+
+
+def test_response_iterparse_discards_wrapped_elements(valid_request, valid_url):
+    items = "".join(
+        f"<li><article class='product_pod'><h3>{i}</h3></article></li>"
+        for i in range(2000)
+    )
+    html_string = f"<html><body><ol>{items}</ol></body></html>"
+    response = Response(request=valid_request, text=html_string, url=valid_url)
+    # Only the elements parsed ahead within the current chunk are kept in the tree
+    tree_sizes = [
+        sum(1 for _ in article.getroottree().iter())
+        for article in response.iterparse("article", chunk_size=1024)
+    ]
+    assert len(tree_sizes) == 2000
+    assert max(tree_sizes) < 100
+
+
+def test_response_iterparse_nested_elements(valid_request, valid_url):
+    html_string = (
+        "<html><body>"
+        "<div class='outer'><div class='inner'><p>1</p></div><p>2</p></div>"
+        "<div class='outer'><p>3</p></div>"
+        "</body></html>"
+    )
+    response = Response(request=valid_request, text=html_string, url=valid_url)
+    divs = [
+        (div.get("class"), [p.text for p in div.iter("p")])
+        for div in response.iterparse("div")
+    ]
+    assert divs == [
+        ("inner", ["1"]),
+        ("outer", ["1", "2"]),
+        ("outer", ["3"]),
+    ]
+    outer = [
+        [p.text for p in div.iter("p")]
+        for div in response.iterparse("div", class_name="outer")
+    ]
+    assert outer == [["1", "2"], ["3"]]
+
+
+def test_response_iterparse_with_json_content_type(valid_data_request, valid_url):
+    response = Response(
+        request=valid_data_request, data={"key": "value"}, url=valid_url
+    )
+    with pytest.raises(
+        ValueError,
+        match="Cannot parse HTML elements when the Request content type is JSON.",
+    ):
+        next(response.iterparse("article"))
+
+
+@pytest.mark.asyncio
+async def test_response_async_html(valid_request, valid_url):
+    html_string = "<html><body><p>Hello, world!</p></body></html>"
+    response = Response(request=valid_request, text=html_string, url=valid_url)
+    html = await response.async_html()
+    assert html is response.html
+    assert html.find("p").text == "Hello, world!"
+
+
+@pytest.mark.asyncio
+async def test_response_async_html_with_json_content_type(
+    valid_data_request, valid_url
+):
+    response = Response(
+        request=valid_data_request, data={"key": "value"}, url=valid_url
+    )
+    with pytest.raises(ValueError, match="Cannot create BeautifulSoup object"):
+        await response.async_html()
+
+
+def test_import_does_not_load_bs4():
+    code = "import sys, dataservice; assert 'bs4' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("model", [Request, InterceptRequest])
+def test_request_models_are_complete_at_import(model):
+    assert model.__pydantic_complete__
@@ -65,11 +65,12 @@ def parse_item(response: Response):
 def test_toy_service(data_service):
     data = tuple(data_service)
     assert len(data) == 40
-    assert set([d["url"] for d in data[:20]]) == set(
-        [f"https://www.foobar.com/item_{i}" for i in range(1, 21)]
-    )
-    assert set([d["url"] for d in data[20:]]) == set(
-        [f"https://www.barbaz.com/item_{i}" for i in range(1, 21)]
+    assert set([d["url"] for d in data]) == set(
+        [
+            f"https://www.{host}.com/item_{i}"
+            for host in ("foobar", "barbaz")
+            for i in range(1, 21)
+        ]
     )
 
 
@@ -77,11 +78,12 @@ def test_toy_service(data_service):
 async def test_toy_async_service(async_data_service):
     data = [datum async for datum in async_data_service]
     assert len(data) == 40
-    assert set([d["url"] for d in data[:20]]) == set(
-        [f"https://www.foobar.com/item_{i}" for i in range(1, 21)]
-    )
-    assert set([d["url"] for d in data[20:]]) == set(
-        [f"https://www.barbaz.com/item_{i}" for i in range(1, 21)]
+    assert set([d["url"] for d in data]) == set(
+        [
+            f"https://www.{host}.com/item_{i}"
+            for host in ("foobar", "barbaz")
+            for i in range(1, 21)
+        ]
     )
 
 
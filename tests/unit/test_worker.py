@@ -1,11 +1,18 @@
 import asyncio
 import logging
+import random
+import threading
+from collections import ChainMap
+from collections.abc import AsyncGenerator
 from contextlib import nullcontext as does_not_raise
+from dataclasses import dataclass
+from unittest import mock
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from dataservice.cache import JsonCache
+from dataservice.clients import HttpXClient
 from dataservice.config import ServiceConfig
 from dataservice.data import BaseDataItem
 from dataservice.exceptions import (
@@ -16,9 +23,15 @@ from dataservice.exceptions import (
     TimeoutException,
 )
 from dataservice.models import Request, Response
-from dataservice.worker import DataWorker
+from dataservice.worker import (
+    BloomFilter,
+    DataWorker,
+    _canonical_key,
+    _wait_decorrelated_jitter,
+)
 from tests.unit.conftest import ToyClient
 
+TOY = ToyClient()
 # TODO Fix broken tests
 
 
@@ -26,7 +39,7 @@ class Foo(BaseDataItem):
     parsed: str
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
     return ServiceConfig()
 
@@ -34,38 +47,48 @@ def config():
 request_with_data_callback = Request(
     url="http://example.com",
     callback=lambda x: {"parsed": "data"},
-    client=ToyClient(),
+    client=TOY,
 )
 
 request_with_data_item_callback = Request(
     url="http://example.com",
     callback=lambda x: Foo(parsed="data"),
-    client=ToyClient(),
+    client=TOY,
 )
 
 
+async def iterator_callback(response):
+    yield Request(
+        url="http://example.com/child",
+        client=TOY,
+        callback=lambda x: {"parsed": "data"},
+    )
+
+
 request_with_iterator_callback = Request(
     url="http://example.com",
-    callback=lambda x: iter(
-        Request(
-            url="http://example.com",
-            client=ToyClient(),
-            callback=lambda x: {"parsed": "data"},
-        )
-    ),
-    client=ToyClient(),
+    callback=iterator_callback,
+    client=TOY,
 )
 
 
 @pytest.fixture
-def data_worker_with_params(request, toy_client, config):
-    if "requests" not in request.param:
-        request.param["requests"] = [request_with_data_callback]
-    if "config" not in request.param:
-        request.param["config"] = config
-    return DataWorker(
-        requests=request.param["requests"], config=request.param["config"]
+def make_request():
+    """Return a factory of requests local to the test, using the toy client and an identity callback by default."""
+
+    def _make_request(url="http://example.com", callback=lambda x: x, **kwargs):
+        kwargs.setdefault("client", TOY)
+        return Request(url=url, callback=callback, **kwargs)
+
+    return _make_request
+
+
+@pytest.fixture
+def data_worker_with_params(request, config):
+    params = ChainMap(
+        request.param, {"requests": [request_with_data_callback], "config": config}
     )
+    return DataWorker(requests=params["requests"], config=params["config"])
 
 
 @pytest.fixture
@@ -82,8 +105,12 @@ def queue_item(request):
 @pytest.mark.parametrize(
     "requests, expected",
     [
-        ([request_with_data_callback], {"parsed": "data"}),
-        ([request_with_data_item_callback], Foo(parsed="data")),
+        pytest.param(
+            [request_with_data_callback], {"parsed": "data"}, id="Dict data item"
+        ),
+        pytest.param(
+            [request_with_data_item_callback], Foo(parsed="data"), id="BaseDataItem"
+        ),
     ],
 )
 async def test_data_worker_handles_request_correctly(requests, expected, config):
@@ -93,7 +120,11 @@ async def test_data_worker_handles_request_correctly(requests, expected, config)
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("data_worker_with_params", [{"requests": []}], indirect=True)
+@pytest.mark.parametrize(
+    "data_worker_with_params",
+    [pytest.param({"requests": []}, id="No requests")],
+    indirect=True,
+)
 async def test_data_worker_handles_empty_queue(data_worker_with_params):
     with pytest.raises(ValueError, match="No requests to process"):
         await data_worker_with_params.fetch()
@@ -109,20 +140,23 @@ async def test_handles_queue_item_puts_dict_in_data_queue(data_worker):
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "data_worker_with_params, queue_item",
-    [({}, request_with_iterator_callback)],
+    [pytest.param({}, request_with_iterator_callback, id="Iterator callback")],
     indirect=True,
 )
 async def test_handles_queue_item_puts_request_in_work_queue(
     data_worker_with_params, queue_item
 ):
     await data_worker_with_params._handle_queue_item(queue_item)
-    assert data_worker_with_params._work_queue.get_nowait() is not None
+    callback_result = data_worker_with_params._work_queue.get_nowait()
+    assert isinstance(callback_result, AsyncGenerator)
+    child = await anext(callback_result)
+    assert child.url == "http://example.com/child"
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "data_worker_with_params",
-    [{}],
+    [pytest.param({}, id="Default worker")],
     indirect=True,
 )
 async def test_handles_queue_item_raises_value_error_for_unknown_type(
@@ -135,15 +169,13 @@ async def test_handles_queue_item_raises_value_error_for_unknown_type(
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "data_worker_with_params",
-    [{"requests": [request_with_data_callback]}],
+    [pytest.param({"requests": [request_with_data_callback]}, id="Data callback")],
     indirect=True,
 )
 async def test_is_duplicate_request_returns_false_for_new_request(
-    data_worker_with_params,
+    data_worker_with_params, make_request
 ):
-    request = Request(
-        url="http://example.com", client=ToyClient(), callback=lambda x: x
-    )
+    request = make_request()
     assert not data_worker_with_params._is_duplicate_request(request)
 
 
@@ -153,6 +185,7 @@ async def test_is_duplicate_request_returns_false_for_new_request(
     [
         (ServiceConfig(**{"deduplication": True, "max_workers": 1}), 1),
         (ServiceConfig(**{"deduplication": False, "max_workers": 1}), 2),
+        (ServiceConfig(**{"bloom_filter": {"capacity": 100}}), 1),
     ],
 )
 async def test_deduplication(config, expected, mocker):
@@ -236,7 +269,7 @@ async def test__handle_request(
         "dataservice.worker.DataWorker._make_request",
         mocker.AsyncMock(side_effect=side_effect),
     )
-    data_worker._clients = {"toyclient": ToyClient()}
+    data_worker._clients = {"toyclient": TOY}
     data_worker.config = ServiceConfig(
         **{
             "retry": {
@@ -298,7 +331,7 @@ async def test_retry_logs(
         "dataservice.worker.DataWorker._make_request",
         mocker.AsyncMock(side_effect=side_effect),
     )
-    data_worker._clients = {"toyclient": ToyClient()}
+    data_worker._clients = {"toyclient": TOY}
     data_worker.config = ServiceConfig(
         **{
             "retry": {
@@ -502,27 +535,13 @@ async def test_handle_request_calls_within_semaphore_limit(concurrency_worker):
         assert mock_handle_request.call_count == len(concurrency_worker._requests)
 
 
-def test_is_duplicate_request(data_worker):
-    request1 = Request(
-        url="http://example.com", method="GET", callback=lambda x: x, client=ToyClient()
-    )
-    request2 = Request(
-        url="http://example.com", method="GET", callback=lambda x: x, client=ToyClient()
-    )
-    request3 = Request(
-        url="http://example.org",
-        method="POST",
-        callback=lambda x: x,
-        client=ToyClient(),
-        json_data={"key": "value"},
-    )
-    request4 = Request(
-        url="http://example.com",
-        method="GET",
-        callback=lambda x: x,
-        client=ToyClient(),
-        params={"key": "value"},
+def test_is_duplicate_request(data_worker, make_request):
+    request1 = make_request(method="GET")
+    request2 = make_request(method="GET")
+    request3 = make_request(
+        "http://example.org", method="POST", json_data={"key": "value"}
     )
+    request4 = make_request(method="GET", params={"key": "value"})
 
     # First request should not be a duplicate
     assert not data_worker._is_duplicate_request(request1)
@@ -545,10 +564,8 @@ def data_worker_with_cache(config_with_cache):
 
 
 @pytest.mark.asyncio
-async def test_make_request_uses_cache(data_worker_with_cache, mocker):
-    request = Request(
-        url="http://example.com", client=ToyClient(), callback=lambda x: x
-    )
+async def test_make_request_uses_cache(data_worker_with_cache, mocker, make_request):
+    request = make_request()
     response = Response(
         request=request, text="cached response", data={}, url="http://example.com"
     )
@@ -577,16 +594,14 @@ async def test_make_request_uses_cache(data_worker_with_cache, mocker):
     ],
 )
 async def test_data_worker_with_cache_write_periodically(
-    mocker, tmp_path, write_periodically, expected_call_count
+    mocker, tmp_path, write_periodically, expected_call_count, make_request
 ):
     cache = JsonCache(tmp_path / "cache.json")
     await cache.load()
     mocked_write_periodically = mocker.patch.object(
         cache, "write_periodically", AsyncMock()
     )
-    requests = [
-        Request(url="http://example.com", callback=lambda x: x, client=ToyClient())
-    ]
+    requests = [make_request()]
     config = ServiceConfig(
         cache={
             "use": True,
@@ -598,3 +613,425 @@ async def test_data_worker_with_cache_write_periodically(
     data_worker = DataWorker(requests, config=config, cache=cache)
     await data_worker.fetch()
     assert mocked_write_periodically.await_count == expected_call_count
+
+
+@pytest.mark.asyncio
+async def test_fetch_does_not_close_clients(config, mocker, make_request):
+    client = HttpXClient()
+    mocked_aclose = mocker.patch.object(client, "aclose", AsyncMock())
+    mocker.patch.object(
+        client,
+        "make_request",
+        AsyncMock(side_effect=lambda req: Response(request=req, text="", url=req.url)),
+    )
+    requests = [
+        make_request(callback=lambda x: {}, client=client),
+        make_request("http://example.com/page", callback=lambda x: {}, client=client),
+    ]
+    data_worker = DataWorker(requests, config=config)
+    await data_worker.fetch()
+    mocked_aclose.assert_not_awaited()
+
+
+async def async_data_callback(response):
+    html = await response.async_html()
+    return {"parsed": html.body.text}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "callback",
+    [
+        pytest.param(async_data_callback, id="Coroutine function"),
+        pytest.param(lambda x: async_data_callback(x), id="Returns a coroutine"),
+    ],
+)
+async def test_data_worker_handles_coroutine_callbacks(callback, config, make_request):
+    request = make_request(callback=callback)
+    data_worker = DataWorker([request], config=config)
+    await data_worker.fetch()
+    assert data_worker.get_data_item() == {
+        "parsed": "This is content for URL: http://example.com/"
+    }
+
+
+def test_bloom_filter():
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    assert bloom_filter.size == 9586
+    assert bloom_filter.hash_count == 7
+    assert len(bloom_filter.bits) == 1199
+    keys = [f"GET http://example.com/{i}" for i in range(1000)]
+    assert all(bloom_filter.add_if_absent(key) for key in keys)
+    assert all(key in bloom_filter for key in keys)
+    assert not any(bloom_filter.add_if_absent(key) for key in keys)
+    false_positives = sum(
+        f"GET http://example.org/{i}" in bloom_filter for i in range(1000)
+    )
+    assert false_positives < 50
+
+
+@pytest.mark.parametrize(
+    "first, second, expected",
+    [
+        pytest.param(
+            {"url": "HTTP://Example.com/path?b=2&a=1"},
+            {"url": "http://example.com/path", "params": {"a": "1", "b": "2"}},
+            True,
+            id="Case and query order",
+        ),
+        pytest.param(
+            {"url": "http://example.com/path"},
+            {"url": "http://example.com/Path"},
+            False,
+            id="Path is case sensitive",
+        ),
+        pytest.param(
+            {
+                "url": "http://example.com",
+                "method": "POST",
+                "json_data": {"a": 1, "b": 2},
+            },
+            {
+                "url": "http://example.com",
+                "method": "POST",
+                "json_data": {"b": 2, "a": 1},
+            },
+            True,
+            id="Body key order",
+        ),
+        pytest.param(
+            {"url": "http://example.com", "method": "POST", "json_data": {"a": 1}},
+            {"url": "http://example.com", "method": "POST", "json_data": {"a": 2}},
+            False,
+            id="Different body",
+        ),
+        pytest.param(
+            {"url": "http://example.com", "method": "POST", "form_data": {"a": "1"}},
+            {"url": "http://example.com", "method": "POST", "json_data": {"a": "1"}},
+            False,
+            id="Form and JSON body",
+        ),
+        pytest.param(
+            {"url": "http://example.com", "method": "POST", "json_data": {1: "a"}},
+            {"url": "http://example.com", "method": "POST", "json_data": {"1": "a"}},
+            True,
+            id="Non-str body keys",
+        ),
+        pytest.param(
+            {"url": "http://example.com", "headers": {"Authorization": "a"}},
+            {"url": "http://example.com", "headers": {"authorization": "a"}},
+            True,
+            id="Header name case",
+        ),
+        pytest.param(
+            {"url": "http://example.com", "headers": {"Authorization": "a"}},
+            {"url": "http://example.com", "headers": {"Authorization": "b"}},
+            False,
+            id="Different headers",
+        ),
+        pytest.param(
+            {"url": "http://example.com", "content_type": "text"},
+            {"url": "http://example.com", "content_type": "json"},
+            False,
+            id="Different content type",
+        ),
+        pytest.param(
+            {"url": "http://example.com"},
+            {"url": "http://example.com", "proxy": {"host": "proxy", "port": 8080}},
+            False,
+            id="Different proxy",
+        ),
+        pytest.param(
+            {"url": "http://example.com"},
+            {"url": "http://example.com", "client": ToyClient()},
+            False,
+            id="Different client",
+        ),
+    ],
+)
+def test_canonical_key(make_request, first, second, expected):
+    first, second = make_request(**first), make_request(**second)
+    assert (_canonical_key(first) == _canonical_key(second)) is expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response_cache_size, cache, expected_call_count",
+    [
+        pytest.param(0, True, 2, id="No response cache"),
+        pytest.param(1, True, 1, id="Response cache"),
+        pytest.param(1, False, 2, id="Request opted out"),
+        pytest.param(1, None, 1, id="GET by default"),
+    ],
+)
+async def test__handle_request_response_cache(
+    mocker, make_request, response_cache_size, cache, expected_call_count
+):
+    request = make_request(cache=cache)
+    other_request = make_request("http://EXAMPLE.com", cache=cache)
+    mocked_make_request = mocker.patch(
+        "dataservice.worker.DataWorker._make_request",
+        mocker.AsyncMock(
+            side_effect=lambda req: Response(request=req, text="", url=req.url)
+        ),
+    )
+    data_worker = DataWorker(
+        [request], config=ServiceConfig(response_cache_size=response_cache_size)
+    )
+    await data_worker._handle_request(request)
+    response = await data_worker._handle_request(other_request)
+    assert response.request is other_request
+    assert mocked_make_request.call_count == expected_call_count
+
+
+@pytest.mark.asyncio
+async def test__handle_request_shares_in_flight_requests(mocker, make_request):
+    async def send(req):
+        await asyncio.sleep(0.01)
+        return Response(request=req, text="", url=req.url)
+
+    mocked_make_request = mocker.patch(
+        "dataservice.worker.DataWorker._make_request",
+        mocker.AsyncMock(side_effect=send),
+    )
+    requests = [make_request() for _ in range(3)]
+    data_worker = DataWorker(requests, config=ServiceConfig())
+    responses = await asyncio.gather(*map(data_worker._handle_request, requests))
+    assert [response.request for response in responses] == requests
+    assert mocked_make_request.call_count == 1
+    assert not data_worker._in_flight
+
+
+@pytest.mark.asyncio
+async def test__handle_request_does_not_share_different_requests(mocker, make_request):
+    async def send(req):
+        await asyncio.sleep(0.01)
+        return Response(request=req, text="", url=req.url)
+
+    mocked_make_request = mocker.patch(
+        "dataservice.worker.DataWorker._make_request",
+        mocker.AsyncMock(side_effect=send),
+    )
+    requests = [
+        make_request(),
+        make_request(client=ToyClient()),
+        make_request(content_type="json"),
+        make_request(headers={"Authorization": "Bearer token"}),
+    ]
+    data_worker = DataWorker(requests, config=ServiceConfig(response_cache_size=10))
+    responses = await asyncio.gather(*map(data_worker._handle_request, requests))
+    assert [response.request for response in responses] == requests
+    assert mocked_make_request.call_count == len(requests)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs, deduplication, expected_call_count",
+    [
+        pytest.param({}, True, 1, id="GET by default"),
+        pytest.param(
+            {"method": "POST", "json_data": {"a": 1}}, True, 3, id="POST by default"
+        ),
+        pytest.param(
+            {"method": "POST", "json_data": {"a": 1}, "cache": True},
+            True,
+            1,
+            id="POST opted in",
+        ),
+        pytest.param({}, False, 3, id="Deduplication disabled"),
+    ],
+)
+async def test__handle_request_shares_in_flight_requests_by_method(
+    mocker, make_request, kwargs, deduplication, expected_call_count
+):
+    async def send(req):
+        await asyncio.sleep(0.01)
+        return Response(request=req, text="", url=req.url)
+
+    mocked_make_request = mocker.patch(
+        "dataservice.worker.DataWorker._make_request",
+        mocker.AsyncMock(side_effect=send),
+    )
+    requests = [make_request(**kwargs) for _ in range(3)]
+    data_worker = DataWorker(
+        requests, config=ServiceConfig(deduplication=deduplication)
+    )
+    await asyncio.gather(*map(data_worker._handle_request, requests))
+    assert mocked_make_request.call_count == expected_call_count
+
+
+@dataclass
+class DataclassClient:
+    """An unhashable client, as dataclasses with the default eq are."""
+
+    text: str
+
+    async def __call__(self, request):
+        return Response(request=request, text=self.text, url=request.url)
+
+
+@pytest.mark.asyncio
+async def test_data_worker_with_unhashable_client(make_request):
+    request = make_request(
+        callback=lambda response: {"text": response.text},
+        client=DataclassClient(text="content"),
+    )
+    data_worker = DataWorker([request], config=ServiceConfig())
+    await data_worker.fetch()
+    assert data_worker.get_data_item() == {"text": "content"}
+
+
+def test_wait_decorrelated_jitter():
+    wait = _wait_decorrelated_jitter(1, 10, random.Random(42))
+    retry_state = mock.Mock(upcoming_sleep=0.0)
+    sleeps = []
+    for _ in range(20):
+        retry_state.upcoming_sleep = wait(retry_state)
+        sleeps.append(retry_state.upcoming_sleep)
+    assert all(1 <= sleep <= 10 for sleep in sleeps)
+    assert sleeps[0] <= 3
+    assert all(s <= max(p * 3, 1) for p, s in zip(sleeps, sleeps[1:]))
+    expected_wait = _wait_decorrelated_jitter(1, 10, random.Random(42))
+    assert expected_wait(mock.Mock(upcoming_sleep=0.0)) == sleeps[0]
+
+
+@pytest.mark.parametrize(
+    "wait_strategy, expected_wait",
+    [
+        pytest.param("exponential", 4, id="Exponential"),
+        pytest.param(
+            "decorrelated_jitter", random.Random(1).uniform(4, 12), id="Jitter"
+        ),
+    ],
+)
+def test_retry_wait(make_request, wait_strategy, expected_wait):
+    config = ServiceConfig(retry={"wait_strategy": wait_strategy, "seed": 1})
+    data_worker = DataWorker([make_request()], config=config)
+    wait = data_worker._retry_wait()
+    assert wait(mock.Mock(attempt_number=1, upcoming_sleep=0.0)) == expected_wait
+
+
+def test_retry_wait_decorrelated_jitter_without_min_wait(make_request):
+    config = ServiceConfig(retry={"wait_exp_min": 0, "seed": 1})
+    data_worker = DataWorker([make_request()], config=config)
+    wait = data_worker._retry_wait()
+    retry_state = mock.Mock(upcoming_sleep=0.0)
+    sleeps = []
+    for _ in range(5):
+        retry_state.upcoming_sleep = wait(retry_state)
+        sleeps.append(retry_state.upcoming_sleep)
+    assert all(1 <= sleep <= 10 for sleep in sleeps)
+
+
+@pytest.mark.asyncio
+async def test_fetch_consumes_callback_generators(config, make_request):
+    def callback(response):
+        yield {"parsed": "first"}
+        yield make_request(
+            "http://example.com/next", callback=lambda x: {"parsed": "next"}
+        )
+        yield {"parsed": "last"}
+
+    request = make_request(callback=callback)
+    data_worker = DataWorker([request], config=config)
+    await data_worker.fetch()
+    data = []
+    while not data_worker.has_no_more_data():
+        data.append(data_worker.get_data_item()["parsed"])
+    assert sorted(data) == ["first", "last", "next"]
+    assert not data_worker.has_jobs()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "generator",
+    [
+        pytest.param(False, id="Function"),
+        pytest.param(True, id="Generator function"),
+    ],
+)
+async def test_fetch_runs_callbacks_off_the_event_loop(make_request, generator):
+    thread_ids = []
+
+    def callback(response):
+        thread_ids.append(threading.get_ident())
+        return {"parsed": "data"}
+
+    def generator_callback(response):
+        yield callback(response)
+
+    request = make_request(callback=generator_callback if generator else callback)
+    data_worker = DataWorker([request], config=ServiceConfig())
+    await data_worker.fetch()
+    assert data_worker.get_data_item() == {"parsed": "data"}
+    assert thread_ids and threading.get_ident() not in thread_ids
+
+
+@pytest.mark.asyncio
+async def test_fetch_runs_max_concurrency_workers(make_request):
+    active, max_active = 0, 0
+
+    async def client(request):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Response(request=request, text="", url=request.url)
+
+    requests = [
+        make_request(f"http://example.com/{i}", callback=lambda x: {}, client=client)
+        for i in range(6)
+    ]
+    data_worker = DataWorker(requests, config=ServiceConfig(max_concurrency=2))
+    await data_worker.fetch()
+    assert max_active == 2
+    assert data_worker._data_queue.qsize() == 6
+
+
+@pytest.mark.asyncio
+async def test_fetch_raises_worker_exception(config, mocker, make_request):
+    mocker.patch(
+        "dataservice.worker.DataWorker._handle_request",
+        AsyncMock(side_effect=DataServiceException("Request exception")),
+    )
+    data_worker = DataWorker([make_request()], config=config)
+    with pytest.raises(DataServiceException, match="Request exception"):
+        await data_worker.fetch()
+
+
+@pytest.mark.asyncio
+async def test_fetch_consumes_async_generator_callbacks(config, make_request):
+    data_worker = DataWorker([make_request(callback=iterator_callback)], config=config)
+    await data_worker.fetch()
+    assert data_worker.get_data_item() == {"parsed": "data"}
+    assert data_worker.has_no_more_data()
+
+
+@pytest.mark.asyncio
+async def test_handle_queue_item_caches_subclass_dispatch(data_worker):
+    await data_worker._handle_queue_item(Foo(parsed="data"))
+    assert data_worker._item_handlers[Foo] == "_handle_data_item"
+    assert data_worker.get_data_item() == Foo(parsed="data")
+    with pytest.raises(ValueError, match="Unknown item type <class 'int'>"):
+        await data_worker._handle_queue_item(1)
+    assert int not in data_worker._item_handlers
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        pytest.param(2, [[0, 1], [2]], id="Partial last batch"),
+        pytest.param(3, [[0, 1, 2]], id="Exact batch"),
+        pytest.param(5, [[0, 1, 2]], id="Larger than queue"),
+    ],
+)
+async def test_get_data_batch(data_worker, size, expected):
+    for i in range(3):
+        await data_worker._add_to_data_queue({"i": i})
+    batches = []
+    while not data_worker.has_no_more_data():
+        batches.append([item["i"] for item in data_worker.get_data_batch(size)])
+    assert batches == expected
+    assert data_worker.get_data_batch(size) == []